@@ -1,14 +1,17 @@
 # Python 3.12+
-import cmath
+from __future__ import annotations
+
 import contextlib
-import tkinter as tk
 from abc import ABC, abstractmethod
 from itertools import count, batched, starmap, pairwise
-from statistics import mean
-from typing import Iterable, Self, Annotated, Generator, Callable
-from math import radians, cos, sin, dist, atan2, isclose
+from typing import Iterable, Self, Annotated, Generator, Callable, TYPE_CHECKING
+from math import radians, cos, sin, dist, atan2, isclose, floor, ceil, fsum
+from geometry import PointType, PolygonMetrics, SimplificationResult, polygon_metrics, simplify_polygon, simplify_stream
 
-type PointType = tuple[int | float, int | float]
+# A tkinter csak a típusjelölésekhez kell, így a modul a grafikus felület betöltése nélkül is importálható.
+if TYPE_CHECKING:
+    import tkinter as tk
+    from views import CanvasView
 
 type AngleDegree = Annotated[int | float, 'szögérték fokban']
 
@@ -17,13 +20,28 @@ class PolygonGraphics(ABC):
     """Absztrakt alaposztály, amelyet a sokszögekből kialakított síkidom konkrét osztályának örökölni kell."""
 
     _instance_counter = count(1)  # Az azonosítócímke létrehozásához használt, példányonkénti egyedi szám generátor.
+    _version_counter = count(1)  # A síkidomok állapotváltozatainak egyedi sorszámát adó generátor.
 
     def __init__(self, canvas: tk.Canvas, **options):
         self.canvas = canvas
+        # A síkidom aktuális állapotának sorszáma. Minden változáskor (csúcspontok, konfiguráció, címkék, csoporttagság)
+        # új, minden síkidomra nézve egyedi értéket kap, így két azonos sorszámú állapot biztosan megegyezik.
+        self._version: int = next(self._version_counter)
+        # A síkidomot tartalmazó csoportok a csoporthoz adás sorrendjében. Az események buborékoltatásához szükséges.
+        self._groups: list[Group] = []
+        # Az az összevont réteg, amelybe a sokszög grafikája be van olvasztva, vagy None, ha nincs beolvasztva.
+        self._baked_layer: BakedLayer | None = None
+        # A csúcspontokból számolt geometriai mértékek gyorsítótára (a PolygonMetrics mezőnevei szerint).
+        # A transzformációk a mértékeket, ahol lehet, frissítik, egyébként a gyorsítótár kiürül.
+        self._metrics: dict[str, object] = {}
+        # A síkidomot további vásznakon megjelenítő nézetek, amelyeket minden változásról értesíteni kell.
+        self._views: list[CanvasView] = []
         # Az új síkidompéldány azonosítócímkéjének előállítása a típusnév és egyedi szám kombinációjával.
         self.id_tag: str = type(self).__name__ + str(next(self._instance_counter))
         # A grafika létrehozása.
         self._create_graphics()
+        # A sokszög rajzelemének nyilvántartásba vétele a vászon eseményelosztójában.
+        EventDispatcher.of(canvas).register(self)
         # Alapértelmezésben az alakzat nincs kitöltve, csak a körvonal látszik.
         self.config(fill='', outline='black', width=1)
         self.config(**options)  # A megadott konfigurációs beállítások érvényesítése.
@@ -50,6 +68,9 @@ class PolygonGraphics(ABC):
         new_inst = self._instance_factory()  # Az új konkrét példány létrehozása.
         new_inst.config(**self.all_cget())  # Az új példány konfigurációjának beállítása az eredetivel megegyezően.
         new_inst.dtag(self.id_tag)  # Az eredeti példány azonosítócímkéjének eltávolítása az új példányról.
+        # Az új példány nem tagja az eredeti példány csoportjainak, ezért azok címkéit sem kaphatja meg.
+        for group in self._groups:
+            new_inst.dtag(group._id_tag)
         new_inst.set_coords(self.get_coords())  # Az új példány csúcspontjainak beállítása az eredetivel megegyezően.
         return new_inst
 
@@ -78,7 +99,7 @@ class PolygonGraphics(ABC):
         x_coords, y_coords = xy_coordinates[::2], xy_coordinates[1::2]
         # Meghatározzuk a csúcspontok középpontját (súlypontját), ami mint az a geometriából ismert, a
         # csúcspontok számtani közepe.
-        center_x, center_y = mean(x_coords), mean(y_coords)
+        center_x, center_y = fsum(x_coords) / len(x_coords), fsum(y_coords) / len(y_coords)
         return center_x, center_y
 
     def _sort_vertices_for_proper_plotting(self, *vertices) -> tuple[PointType, ...]:
@@ -128,19 +149,27 @@ class PolygonGraphics(ABC):
                 raise ValueError('A "tags" konfigurációs paraméter értéke string vagy string sorozat lehet')
             options['tags'] = tags_string
 
+        self._unbake()  # A beolvasztás megszüntetése a rejtett állapot visszaállításával jár, ezért a beállítás előtt kell.
         self.canvas.itemconfig(self.id_tag, **options)
+        self._changed(keep_metrics=True)
 
     configure = config
 
     def cget(self, option: str) -> str:
         """A sokszög option által megadott konfigurációs paraméterének aktuális értékével tér vissza."""
+        # Az összevont rétegbe olvasztott sokszög rejtett, de kifelé a beolvasztás előtti állapotát mutatja.
+        if option == 'state' and self._baked_layer is not None:
+            return self._baked_layer.member_state(self)
         return self.canvas.itemcget(self.id_tag, option)
 
     config_option_value = cget
 
     def all_cget(self) -> dict:
         """A sokszög összes konfigurációs paraméterét és aktuális értékét adja vissza."""
-        return {k: v[-1] for k, v in self.canvas.itemconfigure(self.id_tag).items()}
+        options = {k: v[-1] for k, v in self.canvas.itemconfigure(self.id_tag).items()}
+        if self._baked_layer is not None:
+            options['state'] = self._baked_layer.member_state(self)
+        return options
 
     all_config_options = all_cget
 
@@ -148,9 +177,142 @@ class PolygonGraphics(ABC):
         """A sokszög pontjainak x, y koordinátáit adja vissza egy listában."""
         return self.canvas.coords(self.id_tag)
 
-    def set_coords(self, *vertices) -> None:
-        """A sokszög pointjait a megadottakra változtatja."""
-        self.canvas.coords(self.id_tag, *self._flatten_xycoords(vertices))
+    def set_coords(self, *vertices, tolerance: int | float | None = None) -> SimplificationResult | None:
+        """A sokszög pointjait a megadottakra változtatja.
+        Ha a tolerance meg van adva, akkor a csúcspontokat a beállítás előtt egyszerűsíti úgy, hogy az eltérés
+        legfeljebb tolerance pixel legyen. Ekkor a csúcspontok folyamként dolgozódnak fel, így nagyon hosszú
+        (pl. importált) pontsorozatok sem kerülnek teljes egészükben a memóriába, és a visszatérési érték az
+        eredeti és az egyszerűsített csúcspontszámot, valamint a csökkenés arányát adja meg.
+        """
+        xy_coordinates = self._flatten_xycoords(vertices)
+        if tolerance is None:
+            self.canvas.coords(self.id_tag, *xy_coordinates)
+            self._changed()
+            return None
+        # A számláló a zip miatt minden beolvasott csúcspontnál eggyel nő, így a végén a következő értéke
+        # az eredeti csúcspontok száma.
+        vertex_counter = count()
+        original_vertices = (vertex for vertex, _ in zip(batched(xy_coordinates, 2), vertex_counter))
+        simplified_vertices = list(simplify_stream(original_vertices, tolerance, closed=True))
+        self.canvas.coords(self.id_tag, *(coord for vertex in simplified_vertices for coord in vertex))
+        self._changed()
+        return SimplificationResult(next(vertex_counter), len(simplified_vertices))
+
+    def simplify(self, tolerance: int | float = 0.5, method: str = 'douglas-peucker',
+                 preserve_topology: bool = False) -> SimplificationResult:
+        """A sokszög csúcspontjainak számát csökkenti úgy, hogy az alakzat legfeljebb tolerance pixellel térjen el
+        az eredetitől. A method értéke 'douglas-peucker' vagy 'visvalingam' lehet. Ha a preserve_topology True,
+        akkor az egyszerűsítés nem tesz önmetszővé egy nem önmetsző sokszöget.
+        A visszatérési érték az eredeti és az egyszerűsített csúcspontszámot, valamint a csökkenés arányát adja meg.
+        """
+        vertices = list(batched(self.get_coords(), 2))
+        simplified_vertices = simplify_polygon(vertices, tolerance, method, preserve_topology)
+        if len(simplified_vertices) < len(vertices):
+            self.set_coords(simplified_vertices)
+        return SimplificationResult(len(vertices), len(simplified_vertices))
+
+    def _changed(self, keep_metrics: bool = False) -> None:
+        """A sokszög csúcspontjainak vagy konfigurációjának megváltozása után hívott metódus.
+        Ha a keep_metrics True, akkor a geometriai mértékek gyorsítótára érvényes, mert a változás nem érintette a
+        geometriát, vagy a hívó a mértékeket már frissítette.
+        """
+        # A megváltozott sokszög már nem lehet része az összevont rétegnek.
+        self._unbake()
+        if not keep_metrics:
+            self._metrics.clear()
+        self._touch()
+
+    def _touch(self) -> None:
+        """A síkidom állapotának megváltozását jelzi azzal, hogy új állapotsorszámot ad neki, és értesíti
+        a síkidomot megjelenítő nézeteket.
+        """
+        self._version = next(self._version_counter)
+        for view in self._views:
+            view.mark_changed(self)
+
+    def _map_metrics(self, point_map: Callable[[float, float], PointType], area_factor: float = 1,
+                     perimeter_factor: float | None = 1, axis_aligned: bool = False) -> None:
+        """A gyorsítótárazott geometriai mértékeket egy olyan transzformáció után frissíti, amely a pontokat a
+        point_map szerint képezi le, a területet area_factor, a kerületet perimeter_factor értékével szorozza.
+        Ha a kerület nem számolható át, akkor a perimeter_factor None. A befoglaló téglalap csak a koordináta-
+        tengelyek irányát megtartó (axis_aligned) transzformációknál számolható át, egyébként törlődik.
+        """
+        metrics = self._metrics
+        if not area_factor:
+            metrics.clear()  # Az elfajult sokszögre nem érvényesek a korábbi mértékek (pl. konvexitás).
+            return
+        if 'centroid' in metrics:
+            metrics['centroid'] = point_map(*metrics['centroid'])
+        if 'area' in metrics:
+            metrics['area'] *= abs(area_factor)
+        if 'perimeter' in metrics:
+            if perimeter_factor is None:
+                del metrics['perimeter']
+            else:
+                metrics['perimeter'] *= perimeter_factor
+        if 'bbox' in metrics:
+            if axis_aligned:
+                x1, y1, x2, y2 = metrics['bbox']
+                (xa, ya), (xb, yb) = point_map(x1, y1), point_map(x2, y2)
+                metrics['bbox'] = min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb)
+            else:
+                del metrics['bbox']
+
+    def _translate_metrics(self, dx, dy) -> None:
+        """A gyorsítótárazott geometriai mértékeket a dx, dy értékű eltolásnak megfelelően frissíti."""
+        self._map_metrics(lambda x, y: (x + dx, y + dy), axis_aligned=True)
+
+    def _scale_metrics(self, ref_x, ref_y, scalefactor_x, scalefactor_y) -> None:
+        """A gyorsítótárazott geometriai mértékeket a scale() metódus szerinti átméretezésnek megfelelően frissíti."""
+        # A kerület csak akkor számolható át, ha az átméretezés mindkét irányban azonos mértékű.
+        perimeter_factor = abs(scalefactor_x) if abs(scalefactor_x) == abs(scalefactor_y) else None
+        self._map_metrics(lambda x, y: (ref_x + (x - ref_x) * scalefactor_x, ref_y + (y - ref_y) * scalefactor_y),
+                          scalefactor_x * scalefactor_y, perimeter_factor, axis_aligned=True)
+
+    def _cached_metric(self, name: str):
+        """A név szerint megadott geometriai mérték gyorsítótárazott értékével tér vissza. Ha az nincs a
+        gyorsítótárban, akkor az összes mértéket újraszámolja a csúcspontokból.
+        """
+        try:
+            return self._metrics[name]
+        except KeyError:
+            self._metrics.update(polygon_metrics(self.get_coords())._asdict())
+            return self._metrics[name]
+
+    def metrics(self) -> PolygonMetrics:
+        """A sokszög csúcspontjaiból számolt összes geometriai mértékkel (terület, kerület, súlypont, befoglaló
+        téglalap, konvexitás) tér vissza.
+        """
+        return PolygonMetrics(*(self._cached_metric(name) for name in PolygonMetrics._fields))
+
+    def area(self) -> float:
+        """A sokszög területét adja vissza."""
+        return self._cached_metric('area')
+
+    def perimeter(self) -> float:
+        """A sokszög kerületét adja vissza."""
+        return self._cached_metric('perimeter')
+
+    def centroid(self) -> tuple[float, float]:
+        """A síkidom tényleges, területi súlypontját adja vissza. Ez általában nem egyezik meg a csúcspontok
+        vertices_centroid() által adott számtani közepével.
+        """
+        return self._cached_metric('centroid')
+
+    def vertices_bbox(self) -> tuple[float, float, float, float]:
+        """A sokszög csúcspontjainak befoglaló téglalapját adja vissza valós koordinátákkal: x1, y1, x2, y2.
+        A bbox() metódussal szemben nem tartalmazza a körvonal vastagságát, és nincs egészekre kerekítve.
+        """
+        return self._cached_metric('bbox')
+
+    def is_convex(self) -> bool:
+        """True értéket ad vissza, ha a sokszög konvex."""
+        return self._cached_metric('convex')
+
+    def _unbake(self) -> None:
+        """Ha a sokszög egy összevont rétegbe van beolvasztva, akkor a réteget megszünteti."""
+        if self._baked_layer is not None:
+            self._baked_layer.unbake()
 
     def gettags(self) -> tuple[str, ...]:
         """A sokszöghöz rendelt tag-eket adja vissza."""
@@ -158,15 +320,49 @@ class PolygonGraphics(ABC):
 
     def add_tag(self, new_tag: str) -> None:
         """A megadott tag-et hozzárendeli a sokszöghöz."""
+        self._unbake()  # Az összevont réteg címkéi a beolvasztáskori címkékből származnak, ezért a réteg megszűnik.
         self.canvas.addtag_withtag(new_tag, self.id_tag)
+        self._touch()
 
     def dtag(self, tag_to_delete: str) -> None:
         """A megadott tag-et eltávolítja a sokszögről. Az azonosítócímkét nem lehet törölni."""
         if tag_to_delete != self.id_tag:
+            self._unbake()
             self.canvas.dtag(self.id_tag, tag_to_delete)
+            self._touch()
 
     delete_tag = dtag
 
+    @staticmethod
+    def _stacking_tags(reference: PolygonGraphics | Group | None) -> tuple[str, ...]:
+        """A megjelenítési sorrendet módosító vászonműveletek viszonyítási címkéjét adja vissza egy elemű
+        sorozatként, vagy üres sorozatot, ha nincs viszonyítási síkidom vagy csoport.
+        """
+        if reference is None:
+            return ()
+        if isinstance(reference, Group):
+            return (reference._id_tag,)
+        reference._unbake()  # A rejtett, rétegbe olvasztott sokszöghöz képest nem lehet helyes sorrendet kialakítani.
+        return (reference.id_tag,)
+
+    def tag_raise(self, above: PolygonGraphics | Group | None = None) -> None:
+        """A sokszöget a megjelenítési sorrendben a megadott síkidom vagy csoport fölé, ennek hiányában a vászon
+        összes rajzeleme fölé helyezi.
+        """
+        self._unbake()
+        self.canvas.tag_raise(self.id_tag, *self._stacking_tags(above))
+        for view in self._views:
+            view.mark_restacked()
+
+    def tag_lower(self, below: PolygonGraphics | Group | None = None) -> None:
+        """A sokszöget a megjelenítési sorrendben a megadott síkidom vagy csoport alá, ennek hiányában a vászon
+        összes rajzeleme alá helyezi.
+        """
+        self._unbake()
+        self.canvas.tag_lower(self.id_tag, *self._stacking_tags(below))
+        for view in self._views:
+            view.mark_restacked()
+
     def bind(self, event_pattern_sequence: str | None = None,
              func: Callable[[tk.Event], None] | None = None, add: bool | None = None) -> str:
         """Az első argumentummal meghatározott eseményt vagy eseménysorozatot és eseménykezelőt
@@ -175,17 +371,25 @@ class PolygonGraphics(ABC):
         eseménykezelők lefutása után lesz meghívva, egyébként az eseményre csak a func lesz végrehajtva.
         A metódus visszatérési értéke egy azonosítő, ami lehetővé teszi a func eseménykezelő
         törlését a unbind() metódussal.
+        Az eseménykezelőt a vászon eseményelosztója tárolja, így a hozzárendelés nem hoz létre új Tcl parancsot.
         """
-        return self.canvas.tag_bind(self.id_tag, event_pattern_sequence, func, add)
+        return EventDispatcher.of(self.canvas).bind((self.id_tag,), event_pattern_sequence, func, add)
 
     def unbind(self, event_pattern_sequence: str, func_id: str | None = None) -> None:
         """Az első argumentummal meghatározott eseményhez vagy eseménysorozathoz kötött, és a funcid értékével
-        azonosított eseménykezelőt eltávolítja.
+        azonosított eseménykezelőt eltávolítja. Ha a funcid nincs megadva, akkor az eseményhez kötött összes
+        eseménykezelőt eltávolítja.
         """
-        self.canvas.tag_unbind(self.id_tag, event_pattern_sequence, func_id)
+        EventDispatcher.of(self.canvas).unbind((self.id_tag,), event_pattern_sequence, func_id)
 
     def bbox(self) -> tuple[int, int, int, int]:
         """A sokszög befoglaló téglalapja bal felső és jobb alsó sarokpontjának koordinátáival tér vissza."""
+        if self._baked_layer is not None:
+            # Az összevont rétegbe olvasztott sokszög rejtett, ezért a vászon nem ad róla befoglaló téglalapot.
+            # Ilyenkor a csúcspontokból határozzuk meg.
+            xy_coordinates = self.get_coords()
+            x_coords, y_coords = xy_coordinates[::2], xy_coordinates[1::2]
+            return floor(min(x_coords)), floor(min(y_coords)), ceil(max(x_coords)), ceil(max(y_coords))
         return self.canvas.bbox(self.id_tag)
 
     def bbox_center(self) -> tuple[int | float, int | float]:
@@ -196,12 +400,17 @@ class PolygonGraphics(ABC):
     def move(self, dx, dy) -> None:
         """A sokszöget az x tengely irányában dx, az y tengely irányában dy értékkel tolja el."""
         self.canvas.move(self.id_tag, dx, dy)
+        self._translate_metrics(dx, dy)
+        self._changed(keep_metrics=True)
 
     def moveto(self, x, y) -> None:
         """A sokszöget áthelyezi olyan módon, hogy befoglaló téglalapjának bal felső pontja
         az x, y koordinátákkal megadott ponton legyen.
         """
+        # A rejtett sokszögnek nincs befoglaló téglalapja, ezért az áthelyezés előtt ki kell venni a rétegből.
+        self._unbake()
         self.canvas.moveto(self.id_tag, x, y)
+        self._changed()
 
     def scale(self, ref_x, ref_y, scalefactor_x, scalefactor_y) -> None:
         """A sokszöget átméretezi az első két argumentummal meghatározott referenciaponthoz képest.
@@ -209,18 +418,29 @@ class PolygonGraphics(ABC):
         az y koordinátájának referenciaponttól vett távolsága pedig az scalefactor_y valós számmal.
         """
         self.canvas.scale(self.id_tag, ref_x, ref_y, scalefactor_x, scalefactor_y)
+        self._scale_metrics(ref_x, ref_y, scalefactor_x, scalefactor_y)
+        self._changed(keep_metrics=True)
 
     def rotate(self, angle: int | float, center_of_rotation: PointType = (0, 0), in_degrees=True) -> None:
         """A sokszöget, annak minden pontját angle szöggel forgatja el a második argumentummal megadott
         forgáspont körül. Ha az utolsó paraméter értéke True akkor a szög fokokban értendő, False esetén radiánban.
         """
         cor = complex(*center_of_rotation)
+        angle_in_radians = radians(angle) if in_degrees else angle
+        rotator = complex(cos(angle_in_radians), sin(angle_in_radians))  # Az egységnyi abszolút értékű forgató szám.
         points_to_rotate: Iterable[complex] = starmap(complex, batched(self.canvas.coords(self.id_tag), 2))
-        rotated_complex_points: Iterable[complex] = (cmath.exp(1j * (radians(angle) if in_degrees else angle)) * (point - cor) + cor
-                                                     for point in points_to_rotate)
+        rotated_complex_points: Iterable[complex] = (rotator * (point - cor) + cor for point in points_to_rotate)
         rotated_points: Iterable[tuple[float, float]] = ((c.real, c.imag) for c in rotated_complex_points)
         self.canvas.coords(self.id_tag, *rotated_points)
 
+        def rotate_point(x, y) -> tuple[float, float]:
+            rotated = rotator * (complex(x, y) - cor) + cor
+            return rotated.real, rotated.imag
+
+        # A forgatás a területet, kerületet és konvexitást nem változtatja, a súlypont együtt fordul a sokszöggel.
+        self._map_metrics(rotate_point)
+        self._changed(keep_metrics=True)
+
     def reflect(self, *one_or_two_points) -> None:
         """A grafikát középpontosan vagy tengelyesen tükrözi.
         Ha az argumentum egy pontot határoz meg, akkor erre a pontra vonatkozó tükrözést végez.
@@ -258,6 +478,8 @@ class PolygonGraphics(ABC):
         points_to_reflect = batched(self.canvas.coords(self.id_tag), 2)
         reflected_points = (self._reflect_point_across_line_complex(*p, x1, y1, x2, y2) for p in points_to_reflect)
         self.canvas.coords(self.id_tag, *reflected_points)
+        self._map_metrics(lambda x, y: self._reflect_point_across_line_complex(x, y, x1, y1, x2, y2))
+        self._changed(keep_metrics=True)
 
     @staticmethod
     def ellipse_arc_points(semi_major_axis: int | float, semi_minor_axis: int | float,
@@ -284,6 +506,100 @@ class PolygonGraphics(ABC):
                 for alpha in (start_angle + angle_increment * i for i in range(number_of_points)))
 
 
+class BakedLayer:
+    """Több, azonos konfigurációjú sokszöget egyetlen vászon rajzelemként megjelenítő összevont réteg.
+    A sokszögeket egyetlen sokszöggé fűzi össze úgy, hogy az egyes sokszögeket az első sokszög kezdőpontjából
+    induló és oda visszatérő, kétszer bejárt szakaszok kötik össze. Mivel a vászon a sokszögek kitöltésénél a
+    páros-páratlan szabályt alkalmazza, ezek a szakaszok nem látszanak, ha a sokszögek nem fedik egymást és
+    nincs körvonaluk. Az összevont sokszögek rejtett állapotban megmaradnak, így a Python objektumok továbbra is
+    használhatók, és bármelyikük módosításakor a réteg megszűnik.
+    """
+    _instance_counter = count(1)  # Az azonosítócímke létrehozásához használt, példányonkénti egyedi szám generátor.
+
+    # Azon konfigurációs paraméterek, amelyek nem befolyásolják, hogy a sokszögek összevonhatók-e.
+    _ignored_options = frozenset(('tags', 'state'))
+
+    def __init__(self, canvas: tk.Canvas, polygon_graphics_objects: Iterable[PolygonGraphics]):
+        self.canvas = canvas
+        self.id_tag: str = type(self).__name__ + str(next(self._instance_counter))
+        self.graphics_objects: list[PolygonGraphics] = list(polygon_graphics_objects)
+        # A réteg azokat a címkéket kapja meg, amelyek minden összevont sokszögön rajta vannak, így az ezekkel
+        # a címkékkel végzett vászonműveletek (pl. csoport eltolása) a rétegre és a sokszögekre egyformán hatnak.
+        common_tags = set.intersection(*(set(g.gettags()) for g in self.graphics_objects))
+        common_tags -= {g.id_tag for g in self.graphics_objects} | {'current'}
+        self.tags: tuple[str, ...] = (self.id_tag, *sorted(common_tags))
+
+        first = self.graphics_objects[0]
+        options = {k: v for k, v in first.all_cget().items() if k not in self._ignored_options}
+        anchor = tuple(first.get_coords()[:2])
+        merged_coords = []
+        for g in self.graphics_objects:
+            coords = g.get_coords()
+            # Minden sokszöget a saját kezdőpontjába visszatérve zárunk le, majd visszatérünk a közös kezdőpontba.
+            merged_coords.extend((*coords, *coords[:2], *anchor))
+        self.canvas.create_polygon(*merged_coords, tags=self.tags, **options)
+        # A réteg közvetlenül a legfelső összevont sokszög fölé kerül, így a megjelenítési sorrend nem változik.
+        self.canvas.tag_raise(self.id_tag, self.graphics_objects[-1].id_tag)
+
+        self._member_states: dict[PolygonGraphics, str] = {}
+        for g in self.graphics_objects:
+            self._member_states[g] = g.cget('state')
+            g._baked_layer = self
+            self.canvas.itemconfig(g.id_tag, state='hidden')
+        EventDispatcher.of(canvas).register(self)
+
+    @classmethod
+    def bake_key(cls, options: dict) -> tuple | None:
+        """A konfigurációs paraméterekből képzett olyan kulccsal tér vissza, amely azonos az összevonható sokszögek
+        esetén. Ha a sokszög nem vonható össze másokkal (pl. mert van körvonala vagy rejtett), akkor None értékkel.
+        """
+        if options.get('outline') or options.get('state') not in ('', 'normal') or \
+                options.get('smooth') not in (None, '', '0', 'false'):
+            return None
+        # Az aktív és a letiltott állapot megjelenése rajzelemenként érvényesül, így összevonás után az egérrel
+        # érintett sokszög helyett a teljes réteg megjelenése változna.
+        if any(k.startswith(('active', 'disabled')) and str(v) not in ('', '0', '0.0')
+               for k, v in options.items()):
+            return None
+        return tuple(sorted((k, v) for k, v in options.items() if k not in cls._ignored_options))
+
+    @staticmethod
+    def bboxes_overlap(polygon1: PolygonGraphics, polygon2: PolygonGraphics) -> bool:
+        """True értéket ad vissza, ha a két sokszög csúcspontjaiból számolt befoglaló téglalapok belseje közös részt tartalmaz."""
+        coords1, coords2 = polygon1.get_coords(), polygon2.get_coords()
+        return (min(coords1[::2]) < max(coords2[::2]) and min(coords2[::2]) < max(coords1[::2]) and
+                min(coords1[1::2]) < max(coords2[1::2]) and min(coords2[1::2]) < max(coords1[1::2]))
+
+    def member_state(self, polygon_graphics_object: PolygonGraphics) -> str:
+        """Az összevont sokszög beolvasztás előtti "state" konfigurációs paraméterének értékével tér vissza."""
+        return self._member_states[polygon_graphics_object]
+
+    def member_at(self, x: int | float, y: int | float) -> PolygonGraphics | None:
+        """Azzal a legfelső összevont sokszöggel tér vissza, amely az x, y pontot tartalmazza, vagy None értékkel."""
+        for g in reversed(self.graphics_objects):
+            coords = g.get_coords()
+            vertices = list(batched(coords, 2))
+            inside = False
+            # Páros-páratlan szabály: a pontból induló vízszintes félegyenes hányszor metszi a sokszög oldalait.
+            for (x1, y1), (x2, y2) in pairwise([*vertices, vertices[0]]):
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+            if inside:
+                return g
+        return None
+
+    def unbake(self) -> None:
+        """A réteget megszünteti, és az összevont sokszögeket a beolvasztás előtti állapotukban újra megjeleníti."""
+        if not self.graphics_objects:
+            return
+        EventDispatcher.of(self.canvas).unregister(self)
+        self.canvas.delete(self.id_tag)
+        for g in self.graphics_objects:
+            g._baked_layer = None
+            self.canvas.itemconfig(g.id_tag, state=self._member_states[g])
+        self.graphics_objects, self._member_states = [], {}
+
+
 class Group:
     """Olyan iterálható konténerobjektum, amely csoportba foglalja a megadott, sokszögből
     előállított grafikaobjektumokat.
@@ -308,14 +624,19 @@ class Group:
 
     def add_graphics(self, *polygon_graphics_objects: PolygonGraphics):
         """Grafikaobjektumok hozzáadása a csoporthoz."""
-        self.graphics_objects.extend(polygon_graphics_objects)
-        for g in self.graphics_objects:
+        for g in polygon_graphics_objects:
+            if self in g._groups:
+                continue  # A csoportnak már tagja.
+            self.graphics_objects.append(g)
+            g._groups.append(self)  # A grafikaobjektum nyilvántartja, hogy mely csoportoknak tagja.
             g.add_tag(self._id_tag)  # A grafikaobjektumokat ellátjuk a csoport azonosító címkéjével.
 
     def remove_graphics(self, *polygon_graphics_objects: PolygonGraphics):
         """Grafikaobjektumok eltávolítása a csoportból."""
         for g in polygon_graphics_objects:
             g.dtag(self._id_tag)  # Az eltávolítandó grafikaobjektumokról töröljük a csoport azonosító címkéjét.
+            with contextlib.suppress(ValueError):
+                g._groups.remove(self)
             # A grafikaobjektumot eltávolítjuk a csoport konténeréből. Ha eleve nincs benne, akkor nem történik semmi.
             with contextlib.suppress(ValueError):
                 self.graphics_objects.remove(g)
@@ -337,19 +658,44 @@ class Group:
         eseménykezelők lefutása után lesz meghívva, egyébként az eseményre csak a func lesz végrehajtva.
         A metódus visszatérési értéke egy azonosítő, ami lehetővé teszi a func eseménykezelő törlését
         az unbind() metódussal.
+        A csoporthoz rendelt eseménykezelő akkor hívódik meg, amikor az esemény a csoport valamely grafikáján
+        következik be, és a grafikához rendelt eseménykezelők egyike sem tért vissza "break" értékkel.
         """
-        return self._get_canvas().tag_bind(self._id_tag, event_pattern_sequence, func, add)
+        return EventDispatcher.of(self._get_canvas()).bind((self._id_tag,), event_pattern_sequence, func, add)
 
     def unbind(self, event_pattern_sequence: str, func_id: str | None = None):
         """Az első argumentummal meghatározott eseményhez vagy eseménysorozathoz kötött, és a funcid értékével
-        azonosított eseménykezelőt eltávolítja.
+        azonosított eseménykezelőt eltávolítja. Ha a funcid nincs megadva, akkor az eseményhez kötött összes
+        eseménykezelőt eltávolítja.
+        """
+        EventDispatcher.of(self._get_canvas()).unbind((self._id_tag,), event_pattern_sequence, func_id)
+
+    def bind_members(self, event_pattern_sequence: str | None = None,
+                     func: Callable[[tk.Event], None] | None = None, add: bool | None = None) -> str:
+        """Az eseménykezelőt a csoport minden grafikájához egyenként társítja egyetlen lépésben.
+        A visszatérési érték egy, az összes grafikára érvényes azonosító, amellyel az unbind_members() metódus
+        a hozzárendelést minden grafikáról egyszerre törli.
+        """
+        member_tags = tuple(g.id_tag for g in self.graphics_objects)
+        return EventDispatcher.of(self._get_canvas()).bind(member_tags, event_pattern_sequence, func, add)
+
+    def unbind_members(self, event_pattern_sequence: str | None = None, func_id: str | None = None) -> None:
+        """A csoport minden grafikájáról eltávolítja az eseményhez vagy eseménysorozathoz kötött, és a funcid
+        értékével azonosított eseménykezelőt. Ha a funcid nincs megadva, akkor az eseményhez kötött összes
+        eseménykezelőt, ha az esemény sincs megadva, akkor a grafikák összes eseménykezelőjét eltávolítja.
         """
-        self._get_canvas().tag_unbind(self._id_tag, event_pattern_sequence, func_id)
+        member_tags = tuple(g.id_tag for g in self.graphics_objects)
+        EventDispatcher.of(self._get_canvas()).unbind(member_tags, event_pattern_sequence, func_id)
 
     def bbox(self) -> tuple[int, int, int, int]:
         """A teljes csoportgrafika befoglaló téglalapja bal felső és jobb alsó sarokpontjának
         koordinátáival tér vissza.
         """
+        if any(self._id_tag not in layer.tags for layer in self._baked_layers()):
+            # Ha a csoport egyes grafikái más csoport rétegébe vannak olvasztva, akkor azok rejtettek, és a vászon
+            # nem számolja őket a befoglaló téglalapba, ezért azt a grafikák befoglaló téglalapjaiból állítjuk elő.
+            x1s, y1s, x2s, y2s = zip(*(g.bbox() for g in self.graphics_objects))
+            return min(x1s), min(y1s), max(x2s), max(y2s)
         return self._get_canvas().bbox(self._id_tag)
 
     def bbox_center(self) -> tuple[int | float, int | float]:
@@ -357,15 +703,47 @@ class Group:
         x1, y1, x2, y2 = self.bbox()
         return (x1 + x2) / 2, (y1 + y2) / 2
 
+    def tag_raise(self, above: PolygonGraphics | Group | None = None) -> None:
+        """A teljes csoportgrafikát a megjelenítési sorrendben a megadott síkidom vagy csoport fölé, ennek
+        hiányában a vászon összes rajzeleme fölé helyezi. A csoport grafikáinak egymáshoz viszonyított sorrendje
+        nem változik.
+        """
+        self._get_canvas().tag_raise(self._id_tag, *PolygonGraphics._stacking_tags(above))
+        self._release_foreign_layers()
+        self._mark_restacked()
+
+    def tag_lower(self, below: PolygonGraphics | Group | None = None) -> None:
+        """A teljes csoportgrafikát a megjelenítési sorrendben a megadott síkidom vagy csoport alá, ennek
+        hiányában a vászon összes rajzeleme alá helyezi. A csoport grafikáinak egymáshoz viszonyított sorrendje
+        nem változik.
+        """
+        self._get_canvas().tag_lower(self._id_tag, *PolygonGraphics._stacking_tags(below))
+        self._release_foreign_layers()
+        self._mark_restacked()
+
+    def _mark_restacked(self) -> None:
+        """A csoport grafikáit megjelenítő nézeteket értesíti a megjelenítési sorrend megváltozásáról."""
+        for view in {view: None for g in self.graphics_objects for view in g._views}:
+            view.mark_restacked()
+
     def move(self, dx, dy) -> None:
         """A teljes csoportgrafikát az x tengely irányában dx, az y tengely irányában dy értékkel tolja el."""
         self._get_canvas().move(self._id_tag, dx, dy)
+        for g in self.graphics_objects:
+            g._translate_metrics(dx, dy)
+            g._touch()
+        self._release_foreign_layers()
 
     def moveto(self, x, y) -> None:
         """A teljes csoportgrafikát áthelyezi olyan módon, hogy befoglaló téglalapjának bal felső pontja
         az x, y koordinátákkal megadott ponton legyen.
         """
+        # A rejtett, rétegbe olvasztott grafikáknak nincs befoglaló téglalapja, ezért előbb a rétegeket meg kell szüntetni.
+        self.unbake()
         self._get_canvas().moveto(self._id_tag, x, y)
+        for g in self.graphics_objects:
+            g._metrics.clear()  # Az eltolás mértéke nem ismert, ezért a mértékeket újra kell számolni.
+            g._touch()
 
     def scale(self, x_origin, y_origin, scalefactor_x, scalefactor_y) -> None:
         """A teljes csoportgrafikát átméretezi az első két argumentummal meghatározott referenciaponthoz képest.
@@ -373,6 +751,10 @@ class Group:
         valós számmal, az y koordinátájának referenciaponttól vett távolsága pedig az scalefactor_y valós számmal.
         """
         self._get_canvas().scale(self._id_tag, x_origin, y_origin, scalefactor_x, scalefactor_y)
+        for g in self.graphics_objects:
+            g._scale_metrics(x_origin, y_origin, scalefactor_x, scalefactor_y)
+            g._touch()
+        self._release_foreign_layers()
 
     def rotate(self, angle: int | float, center_of_rotation: PointType = (0, 0), in_degrees=True) -> None:
         """A teljes csoportgrafikát az angle szöggel elforgatja a második argumentummal megadott forgáspont
@@ -397,3 +779,201 @@ class Group:
          foglaltakal megegyező jellemzőkkel.
          """
         return type(self)(*[g.clone() for g in self.graphics_objects])
+
+    def metrics(self) -> dict[PolygonGraphics, PolygonMetrics]:
+        """A csoport minden grafikájának geometriai mértékeit adja vissza egy grafika -> mértékek szótárban.
+        Azon grafikák csúcspontjait, amelyek mértékei nincsenek teljes egészében a gyorsítótárban, egyetlen Tcl
+        hívással kéri le a vászontól, és a mértékeket egy menetben számolja ki.
+        """
+        outdated = [g for g in self.graphics_objects if len(g._metrics) < len(PolygonMetrics._fields)]
+        if outdated:
+            canvas = self._get_canvas()
+            # A Tcl lmap parancsa az összes grafika koordinátáit egyetlen listában adja vissza.
+            coords_lists = canvas.tk.splitlist(
+                canvas.tk.eval(f'lmap tag {{{" ".join(g.id_tag for g in outdated)}}} {{{canvas} coords $tag}}'))
+            for g, coords in zip(outdated, coords_lists):
+                g._metrics.update(polygon_metrics([float(c) for c in canvas.tk.splitlist(coords)])._asdict())
+        return {g: g.metrics() for g in self.graphics_objects}
+
+    def simplify(self, tolerance: int | float = 0.5, method: str = 'douglas-peucker',
+                 preserve_topology: bool = False) -> SimplificationResult:
+        """A csoport minden grafikájának csúcspontjait egyszerűsíti a PolygonGraphics.simplify() metódussal.
+        A visszatérési érték a csoport összesített eredeti és egyszerűsített csúcspontszámát adja meg.
+        """
+        return sum((g.simplify(tolerance, method, preserve_topology) for g in self.graphics_objects),
+                   SimplificationResult(0, 0))
+
+    def _baked_layers(self) -> list[BakedLayer]:
+        """Azon összevont rétegek listáját adja vissza, amelyekbe a csoport grafikái be vannak olvasztva."""
+        layers = []
+        for g in self.graphics_objects:
+            if g._baked_layer is not None and g._baked_layer not in layers:
+                layers.append(g._baked_layer)
+        return layers
+
+    def _release_foreign_layers(self) -> None:
+        """A csoport címkéjével végzett vászonművelet után megszünteti azokat a rétegeket, amelyeket a művelet nem
+        érintett, mert nem viselik a csoport címkéjét, így a bennük lévő grafikák már nem egyeznek a réteggel.
+        """
+        for layer in self._baked_layers():
+            if self._id_tag not in layer.tags:
+                layer.unbake()
+
+    def bake(self) -> list[BakedLayer]:
+        """A csoport változatlan grafikáit kevesebb rajzelembe vonja össze, hogy a vászon újrarajzolása gyorsabb legyen.
+        Egy rétegbe azok a grafikák kerülnek, amelyek a megjelenítési sorrendben közvetlenül egymást követik,
+        konfigurációjuk azonos, nincs körvonaluk és befoglaló téglalapjaik nem fedik egymást. Az összevont
+        grafikák rejtve megmaradnak, és bármelyikük módosításakor a rétegük automatikusan megszűnik.
+        A visszatérési érték a létrehozott rétegek listája.
+        """
+        canvas = self._get_canvas()
+        # A vászon összes rajzelemének megjelenítési sorrendbeli helye.
+        display_positions = {item: position for position, item in enumerate(canvas.find_withtag('all'))}
+        members = sorted((g for g in self.graphics_objects if g._baked_layer is None),
+                         key=lambda g: display_positions[canvas.find_withtag(g.id_tag)[0]])
+
+        runs: list[list[PolygonGraphics]] = []
+        previous_position, previous_key = None, None
+        for g in members:
+            position = display_positions[canvas.find_withtag(g.id_tag)[0]]
+            options = g.all_cget()
+            key = BakedLayer.bake_key(options)
+            if key is not None and key == previous_key and position == previous_position + 1 and \
+                    not any(BakedLayer.bboxes_overlap(g, other) for other in runs[-1]):
+                runs[-1].append(g)
+            else:
+                runs.append([g])
+            previous_position, previous_key = position, key
+
+        return [BakedLayer(canvas, run) for run in runs if len(run) > 1]
+
+    def unbake(self) -> None:
+        """A csoport grafikáit tartalmazó összes összevont réteget megszünteti."""
+        for layer in self._baked_layers():
+            layer.unbake()
+
+
+class EventDispatcher:
+    """Vásznanként egy példányban létező eseményelosztó, amely a síkidomokhoz és csoportokhoz rendelt
+    eseménykezelőket hívja meg.
+    Minden eseménytípushoz csak egyetlen, a vászon összes rajzelemére érvényes Tcl szintű kötést hoz létre.
+    Az esemény bekövetkezésekor a rajzelem azonosítója alapján megkeresi a hozzá tartozó síkidomot, és először
+    a síkidomhoz, majd a síkidomot tartalmazó csoportokhoz rendelt eseménykezelőket hívja meg (buborékoltatás).
+    Ha egy eseménykezelő a "break" sztringgel tér vissza, akkor a további eseménykezelők már nem hívódnak meg.
+    """
+    # A vásznakhoz tartozó eseményelosztók. A vászon megsemmisülésekor az eseményelosztója is törlődik.
+    _dispatchers: dict[tk.Canvas, 'EventDispatcher'] = {}
+    _func_id_counter = count(1)  # Az eseménykezelő-azonosítók létrehozásához használt egyedi szám generátor.
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        # Rajzelem azonosító -> síkidom vagy összevont réteg leképezés.
+        self._items: dict[int, PolygonGraphics | BakedLayer] = {}
+        # A nyilvántartás mérete a legutóbbi tisztításkor. A vászonról törölt rajzelemek bejegyzései akkor
+        # törlődnek, amikor a nyilvántartás mérete ennek kétszeresére nő.
+        self._pruned_size = 0
+        # Címke -> esemény -> eseménykezelő-azonosító -> eseménykezelő leképezés.
+        self._handlers: dict[str, dict[str, dict[str, Callable[[tk.Event], None]]]] = {}
+        self._bound_sequences: set[str] = set()  # Azon események, amelyekhez már van vászonszintű kötés.
+
+    @classmethod
+    def of(cls, canvas: tk.Canvas) -> Self:
+        """A megadott vászonhoz tartozó eseményelosztóval tér vissza. Ha még nincs ilyen, akkor létrehozza."""
+        try:
+            return cls._dispatchers[canvas]
+        except KeyError:
+            dispatcher = cls._dispatchers[canvas] = cls(canvas)
+            canvas.bind('<Destroy>', dispatcher._on_destroy, '+')
+            return dispatcher
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        """A vászon megsemmisülésekor az eseményelosztót és annak nyilvántartásait törli."""
+        if event.widget is not self.canvas:
+            return
+        if self._dispatchers.get(self.canvas) is self:
+            del self._dispatchers[self.canvas]
+        self._items.clear()
+        self._handlers.clear()
+
+    def register(self, polygon_graphics_object: PolygonGraphics | BakedLayer) -> None:
+        """A síkidom rajzelemeit nyilvántartásba veszi, hogy az eseményeket a síkidomhoz lehessen irányítani.
+        Ha egy rajzelem már egy másik síkidomhoz tartozott, akkor ezután az új síkidomhoz fog tartozni.
+        Összevont réteg esetén az eseményt a réteg azon sokszöge kapja, amelyen az esemény bekövetkezett.
+        """
+        for item in self.canvas.find_withtag(polygon_graphics_object.id_tag):
+            self._items[item] = polygon_graphics_object
+        if len(self._items) > 2 * self._pruned_size:
+            self._prune()
+
+    def _prune(self) -> None:
+        """A vászonról már törölt rajzelemek bejegyzéseit törli a nyilvántartásból."""
+        existing_items = set(self.canvas.find_all())
+        self._items = {item: target for item, target in self._items.items() if item in existing_items}
+        self._pruned_size = len(self._items)
+
+    def unregister(self, polygon_graphics_object: PolygonGraphics | BakedLayer) -> None:
+        """A síkidomhoz vagy összevont réteghez tartozó rajzelemeket törli a nyilvántartásból."""
+        for item in self.canvas.find_withtag(polygon_graphics_object.id_tag):
+            if self._items.get(item) is polygon_graphics_object:
+                del self._items[item]
+
+    def bind(self, tags: Iterable[str], event_pattern_sequence: str | None = None,
+             func: Callable[[tk.Event], None] | None = None, add: bool | None = None) -> str | tuple[str, ...]:
+        """Az eseménykezelőt a megadott címkék mindegyikéhez társítja, és egy közös azonosítóval tér vissza.
+        Ha az add nem True igazságértékű, akkor a címkékhez az eseményre korábban rendelt eseménykezelők törlődnek.
+        Eseménykezelő nélkül hívva az első címkéhez tartozó események (ha az esemény sincs megadva), vagy
+        az eseményhez rendelt eseménykezelők azonosítóinak sorozatát adja vissza.
+        """
+        tags = tuple(tags)
+        if func is None:
+            bindings = self._handlers.get(tags[0], {}) if tags else {}
+            if event_pattern_sequence is None:
+                return tuple(bindings)
+            return tuple(bindings.get(event_pattern_sequence, ()))
+
+        if event_pattern_sequence not in self._bound_sequences:
+            # Az eseményhez a vászon minden rajzelemére érvényes "all" címkén keresztül egyetlen kötés jön létre.
+            self.canvas.tag_bind('all', event_pattern_sequence,
+                                 lambda event, sequence=event_pattern_sequence: self._dispatch(event, sequence), '+')
+            self._bound_sequences.add(event_pattern_sequence)
+
+        func_id = f'dispatch{next(self._func_id_counter)}'
+        for tag in tags:
+            sequence_handlers = self._handlers.setdefault(tag, {})
+            if not add:
+                sequence_handlers.pop(event_pattern_sequence, None)
+            sequence_handlers.setdefault(event_pattern_sequence, {})[func_id] = func
+        return func_id
+
+    def unbind(self, tags: Iterable[str], event_pattern_sequence: str | None = None, func_id: str | None = None) -> None:
+        """A megadott címkékről eltávolítja az eseményhez kötött, és a func_id értékével azonosított eseménykezelőt.
+        Ha a func_id nincs megadva, akkor az eseményhez kötött összes eseménykezelőt, ha az esemény sincs megadva,
+        akkor a címkékhez kötött összes eseménykezelőt eltávolítja. A vászonszintű kötések megmaradnak.
+        """
+        for tag in tags:
+            if event_pattern_sequence is None:
+                self._handlers.pop(tag, None)
+            elif func_id is None:
+                self._handlers.get(tag, {}).pop(event_pattern_sequence, None)
+            else:
+                self._handlers.get(tag, {}).get(event_pattern_sequence, {}).pop(func_id, None)
+
+    def _dispatch(self, event: tk.Event, event_pattern_sequence: str) -> str | None:
+        """Az eseményt kiváltó rajzelemhez tartozó síkidom, majd annak csoportjai eseménykezelőit hívja meg."""
+        current_items = self.canvas.find_withtag('current')
+        if not current_items:
+            return None
+        target = self._items.get(current_items[0])
+        if isinstance(target, BakedLayer):
+            target = target.member_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if target is None:
+            return None
+        # Az esemény a síkidomtól a csoportjai felé halad.
+        for tag in (target.id_tag, *(g._id_tag for g in target._groups)):
+            handlers = self._handlers.get(tag, {}).get(event_pattern_sequence)
+            if not handlers:
+                continue
+            for func in list(handlers.values()):
+                if func(event) == 'break':
+                    return 'break'
+        return None
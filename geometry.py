@@ -0,0 +1,306 @@
+# Python 3.12+
+import heapq
+from itertools import islice, chain
+from typing import Iterable, Sequence, NamedTuple, Generator
+from math import dist, hypot, fsum, atan2, pi, isclose
+
+type PointType = tuple[int | float, int | float]
+
+
+class SimplificationResult(NamedTuple):
+    """A csúcspont-egyszerűsítés eredményét leíró adatok: az eredeti és az egyszerűsített csúcspontok száma."""
+    original_vertex_count: int
+    simplified_vertex_count: int
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Az elhagyott csúcspontok aránya az eredeti csúcspontok számához képest (0 és 1 közötti érték)."""
+        if not self.original_vertex_count:
+            return 0.0
+        return 1 - self.simplified_vertex_count / self.original_vertex_count
+
+    def __add__(self, other: 'SimplificationResult') -> 'SimplificationResult':
+        return SimplificationResult(self.original_vertex_count + other.original_vertex_count,
+                                    self.simplified_vertex_count + other.simplified_vertex_count)
+
+
+class PolygonMetrics(NamedTuple):
+    """Egy sokszög csúcspontjaiból számolt geometriai mértékei."""
+    area: float  # A terület (mindig nemnegatív).
+    perimeter: float  # A kerület.
+    centroid: PointType  # A síkidom tényleges (területi) súlypontja.
+    bbox: tuple[float, float, float, float]  # A csúcspontok befoglaló téglalapja: x1, y1, x2, y2.
+    convex: bool  # True, ha a sokszög konvex.
+
+
+def polygon_metrics(xy_coordinates: Sequence[float]) -> PolygonMetrics:
+    """A sokszög geometriai mértékeit adja vissza az x1, y1, x2, y2, ..., xn, yn koordinátasorozatból.
+    A területet és súlypontot a Gauss-féle trapézformulával (shoelace) számolja. A terület nélküli (elfajult)
+    sokszög súlypontjának a csúcspontok számtani közepét tekinti.
+    """
+    x_coords, y_coords = list(xy_coordinates[0::2]), list(xy_coordinates[1::2])
+    # Minden csúcsponthoz a következő csúcspont tartozik; az utolsóhoz az első.
+    next_x_coords, next_y_coords = x_coords[1:] + x_coords[:1], y_coords[1:] + y_coords[:1]
+    cross_products = [x1 * y2 - x2 * y1 for x1, y1, x2, y2 in zip(x_coords, y_coords, next_x_coords, next_y_coords)]
+    edge_vectors = [(x2 - x1, y2 - y1) for x1, y1, x2, y2 in zip(x_coords, y_coords, next_x_coords, next_y_coords)]
+
+    double_signed_area = fsum(cross_products)
+    if double_signed_area:
+        centroid = (fsum((x1 + x2) * c for x1, x2, c in zip(x_coords, next_x_coords, cross_products)) / (3 * double_signed_area),
+                    fsum((y1 + y2) * c for y1, y2, c in zip(y_coords, next_y_coords, cross_products)) / (3 * double_signed_area))
+    else:
+        centroid = fsum(x_coords) / len(x_coords), fsum(y_coords) / len(y_coords)
+
+    return PolygonMetrics(area=abs(double_signed_area) / 2,
+                          perimeter=fsum(hypot(dx, dy) for dx, dy in edge_vectors),
+                          centroid=centroid,
+                          bbox=(min(x_coords), min(y_coords), max(x_coords), max(y_coords)),
+                          convex=bool(double_signed_area) and _is_convex(edge_vectors))
+
+
+def _is_convex(edge_vectors: Sequence[PointType]) -> bool:
+    """True értéket ad vissza, ha az oldalvektoraival megadott sokszög konvex, vagyis minden csúcsában azonos
+    irányba fordul, sehol sem fordul vissza, és a fordulási szögek összege pontosan egy teljes fordulat.
+    """
+    edges = [(dx, dy) for dx, dy in edge_vectors if dx or dy]  # Az ismétlődő csúcspontok nulla hosszú oldalai nem számítanak.
+    if len(edges) < 3:
+        return False
+    turns = [atan2(dx1 * dy2 - dy1 * dx2, dx1 * dx2 + dy1 * dy2) for (dx1, dy1), (dx2, dy2) in zip(edges, edges[1:] + edges[:1])]
+    if any(t > 0 for t in turns) and any(t < 0 for t in turns):
+        return False
+    # A visszaforduló (ellentétes irányú) szomszédos oldalak fordulási szöge ±π, és két ilyen fordulat összege
+    # egy teljes fordulatnak adódna, pedig az ilyen sokszög elfajult.
+    if any(isclose(abs(t), pi) for t in turns):
+        return False
+    return isclose(abs(fsum(turns)), 2 * pi)
+
+
+def point_segment_distance(point: PointType, start: PointType, end: PointType) -> float:
+    """A pontnak a start és end pontok által meghatározott szakasztól mért távolságát adja vissza."""
+    (x, y), (x1, y1), (x2, y2) = point, start, end
+    dx, dy = x2 - x1, y2 - y1
+    length_squared = dx * dx + dy * dy
+    if not length_squared:
+        return dist(point, start)
+    # A pont vetületének helye a szakaszon, a szakasz két végpontja közé szorítva.
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length_squared))
+    return hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+def _douglas_peucker_indices(points: Sequence[PointType], tolerance: float) -> list[int]:
+    """A nyitott töröttvonal Douglas–Peucker algoritmussal megtartott pontjainak indexeit adja vissza növekvő sorrendben.
+    A két végpont mindig megmarad.
+    """
+    last = len(points) - 1
+    if last < 2:
+        return list(range(len(points)))
+    kept = {0, last}
+    # A rekurzió helyett veremmel dolgozunk, hogy hosszú pontsorozatoknál se fogyjon el a hívási verem.
+    stack = [(0, last)]
+    while stack:
+        first, end = stack.pop()
+        max_distance, max_index = 0.0, None
+        for i in range(first + 1, end):
+            distance = point_segment_distance(points[i], points[first], points[end])
+            if distance > max_distance:
+                max_distance, max_index = distance, i
+        if max_index is not None and max_distance > tolerance:
+            kept.add(max_index)
+            stack.extend(((first, max_index), (max_index, end)))
+    return sorted(kept)
+
+
+def _visvalingam_indices(points: Sequence[PointType], tolerance: float) -> list[int]:
+    """A zárt sokszög Visvalingam–Whyatt algoritmussal megtartott csúcspontjainak indexeit adja vissza.
+    A csúcspontok a szomszédaikkal alkotott háromszög területének sorrendjében esnek ki, de csak akkor, ha a
+    csúcspont a szomszédait összekötő szakasztól legfeljebb tolerance távolságra van.
+    """
+    n = len(points)
+    if n <= 3:
+        return list(range(n))
+    previous, following = [(i - 1) % n for i in range(n)], [(i + 1) % n for i in range(n)]
+    removed = [False] * n
+
+    def triangle_area(i: int) -> float:
+        (x1, y1), (x2, y2), (x3, y3) = points[previous[i]], points[i], points[following[i]]
+        return abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)) / 2
+
+    areas = [triangle_area(i) for i in range(n)]
+    heap = [(area, i) for i, area in enumerate(areas)]
+    heapq.heapify(heap)
+    remaining = n
+    while heap and remaining > 3:
+        area, i = heapq.heappop(heap)
+        if removed[i] or area != areas[i]:
+            continue  # Elavult bejegyzés: a csúcspont területe időközben megváltozott.
+        p, f = previous[i], following[i]
+        if point_segment_distance(points[i], points[p], points[f]) > tolerance:
+            continue  # A csúcspont most nem hagyható el; ha a szomszédai változnak, újra sorra kerül.
+        removed[i] = True
+        remaining -= 1
+        following[p], previous[f] = f, p
+        for neighbour in (p, f):
+            # A szomszéd területe nem lehet kisebb az elhagyott csúcsénál, így a sorrend a kiesés sorrendje marad.
+            areas[neighbour] = max(triangle_area(neighbour), area)
+            heapq.heappush(heap, (areas[neighbour], neighbour))
+    return [i for i in range(n) if not removed[i]]
+
+
+def _orientation(p: PointType, q: PointType, r: PointType) -> float:
+    """A p, q, r pontok körüljárási irányát jellemző előjeles érték (a pq és pr vektorok vektoriális szorzata)."""
+    return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+
+def segments_intersect(p1: PointType, p2: PointType, p3: PointType, p4: PointType) -> bool:
+    """True értéket ad vissza, ha a p1, p2 és a p3, p4 végpontú szakaszok belső pontban metszik egymást."""
+    d1, d2 = _orientation(p3, p4, p1), _orientation(p3, p4, p2)
+    d3, d4 = _orientation(p1, p2, p3), _orientation(p1, p2, p4)
+    return bool(d1 and d2 and d3 and d4) and (d1 > 0) != (d2 > 0) and (d3 > 0) != (d4 > 0)
+
+
+def _self_intersecting_edges(points: Sequence[PointType], indices: list[int]) -> set[int]:
+    """A megtartott csúcspontokból álló zárt sokszög azon oldalainak sorszámait adja vissza, amelyek metszik a
+    sokszög valamely nem szomszédos oldalát.
+    """
+    m = len(indices)
+    edges = [(points[indices[k]], points[indices[(k + 1) % m]]) for k in range(m)]
+    crossing = set()
+    for k in range(m):
+        for j in range(k + 2, m):
+            if k == 0 and j == m - 1:
+                continue  # Az első és utolsó oldal szomszédos.
+            if segments_intersect(*edges[k], *edges[j]):
+                crossing.update((k, j))
+    return crossing
+
+
+def _preserve_topology(points: Sequence[PointType], indices: list[int]) -> list[int]:
+    """Az egyszerűsítés során keletkezett önmetszéseket megszünteti úgy, hogy a metsző oldalak által elhagyott
+    eredeti csúcspontok közül mindig a legtávolabbit visszaveszi, amíg van metszés és van visszavehető csúcspont.
+    """
+    n = len(points)
+    while crossing := _self_intersecting_edges(points, indices):
+        restored = set()
+        for k in crossing:
+            first, end = indices[k], indices[(k + 1) % len(indices)]
+            skipped = [i % n for i in range(first + 1, end if end > first else end + n)]
+            if skipped:
+                restored.add(max(skipped, key=lambda i: point_segment_distance(points[i], points[first], points[end])))
+        if not restored:
+            break  # Az eredeti sokszög is önmetsző, ezt az egyszerűsítés nem tudja megszüntetni.
+        indices = sorted({*indices, *restored})
+    return indices
+
+
+def simplify_polygon(points: Sequence[PointType], tolerance: float, method: str = 'douglas-peucker',
+                     preserve_topology: bool = False) -> list[PointType]:
+    """A zárt sokszög csúcspontjainak számát csökkenti úgy, hogy az eltérés az eredeti alakzattól nagyjából a
+    tolerance értékén (pixelben) belül maradjon. A method értéke 'douglas-peucker' vagy 'visvalingam' lehet.
+    Ha a preserve_topology True, akkor az eredmény nem lehet önmetsző (feltéve, hogy az eredeti sem az).
+    Az eredmény legalább három csúcspontból áll, ha az eredeti is legalább ennyiből állt.
+    """
+    points = list(points)
+    if len(points) <= 3:
+        return points
+    if method == 'douglas-peucker':
+        # A zárt sokszöget olyan nyitott töröttvonalként kezeljük, amelynek az első és utolsó pontja azonos.
+        indices = _douglas_peucker_indices([*points, points[0]], tolerance)[:-1]
+        if len(indices) == 1:
+            # Minden csúcspont a tűréshatáron belül van a kezdőponttól: a tőle legtávolabbi csúcspontot vesszük hozzá.
+            start = indices[0]
+            indices = sorted((start, max((i for i in range(len(points)) if i != start),
+                                         key=lambda i: dist(points[i], points[start]))))
+        if len(indices) < 3:
+            # A legtávolabbi pontpárt alkotó két csúcsponthoz a tőlük mért legtávolabbi csúcspontot vesszük hozzá.
+            first, end = indices[0], indices[-1]
+            farthest = max((i for i in range(len(points)) if i not in indices),
+                           key=lambda i: point_segment_distance(points[i], points[first], points[end]))
+            indices = sorted((*indices, farthest))
+    elif method == 'visvalingam':
+        indices = _visvalingam_indices(points, tolerance)
+    else:
+        raise ValueError('Az egyszerűsítés módszere "douglas-peucker" vagy "visvalingam" lehet.')
+
+    if preserve_topology:
+        indices = _preserve_topology(points, indices)
+    return [points[i] for i in indices]
+
+
+def simplify_stream(points: Iterable[PointType], tolerance: float, chunk_size: int = 4096,
+                    closed: bool = False) -> Generator[PointType, None, None]:
+    """Tetszőlegesen hosszú csúcspontsorozatot egyszerűsít a Douglas–Peucker algoritmussal úgy, hogy egyszerre
+    legfeljebb chunk_size pontot tart a memóriában. A sorozatot chunk_size hosszú szakaszokra bontja, amelyek
+    végpontjai mindig megmaradnak, így az eltérés minden szakaszon a tolerance értékén belül marad.
+    Ha a closed True, akkor a pontsorozat egy zárt sokszög körvonala: az utolsó és az első pontot összekötő oldal
+    is egyszerűsödik, és az eredmény legalább három csúcspontból áll, ha az eredeti is legalább ennyiből állt.
+    """
+    if chunk_size < 3:
+        raise ValueError('A szakaszok hossza legalább 3 pont kell, hogy legyen.')
+    iterator = iter(points)
+    if not closed:
+        yield from (point for _, point in _douglas_peucker_stream(enumerate(iterator), tolerance, chunk_size))
+        return
+
+    first_chunk = list(islice(iterator, chunk_size))
+    following_point = list(islice(iterator, 1))
+    if not following_point:
+        # A teljes sokszög elfér egy szakaszban, így a zárt sokszögekre vonatkozó egyszerűsítés alkalmazható.
+        yield from simplify_polygon(first_chunk, tolerance)
+        return
+
+    # A legalább három csúcspont biztosításához a csúcspontok egy legfeljebb chunk_size elemű, egyenletes
+    # mintáját tartjuk meg: ha a minta megtelik, akkor minden második elemét elhagyjuk, és ezután a mintavétel
+    # lépésköze kétszeres lesz.
+    sample: list[tuple[int, PointType]] = []
+    sample_step = 1
+
+    def sampled(indexed_points: Iterable[tuple[int, PointType]]) -> Generator[tuple[int, PointType], None, None]:
+        nonlocal sample, sample_step
+        for index, point in indexed_points:
+            if index % sample_step == 0:
+                sample.append((index, point))
+                if len(sample) > chunk_size:
+                    sample, sample_step = sample[::2], sample_step * 2
+            yield index, point
+
+    # A körvonalat az első pont megismétlésével zárjuk le, így a záró oldal is a töröttvonal része lesz.
+    outline = chain(first_chunk, following_point, iterator, first_chunk[:1])
+    simplified = _douglas_peucker_stream(sampled(enumerate(outline)), tolerance, chunk_size)
+    # Az utolsó három kiadandó pontot visszatartjuk: a legutolsó a lezáráshoz megismételt első pont, a többire
+    # pedig szükség lehet, ha a teljes eredmény háromnál kevesebb csúcspontból állna.
+    held_back: list[tuple[int, PointType]] = []
+    yielded_count = 0
+    for indexed_point in simplified:
+        held_back.append(indexed_point)
+        if len(held_back) > 3:
+            yield held_back.pop(0)[1]
+            yielded_count += 1
+    closing_index, _ = held_back.pop()
+    while yielded_count + len(held_back) < 3:
+        kept_indices = {closing_index, *(index for index, _ in held_back)}
+        candidates = [(index, point) for index, point in sample if index not in kept_indices]
+        if not candidates:
+            break
+        start, end = held_back[0][1], held_back[-1][1]
+        held_back.append(max(candidates, key=lambda candidate: point_segment_distance(candidate[1], start, end)))
+        held_back.sort()
+    yield from (point for _, point in held_back)
+
+
+def _douglas_peucker_stream(indexed_points: Iterable[tuple[int, PointType]], tolerance: float,
+                            chunk_size: int) -> Generator[tuple[int, PointType], None, None]:
+    """A sorszámozott pontok nyitott töröttvonalát szakaszonként egyszerűsíti a Douglas–Peucker algoritmussal,
+    és a megtartott pontokat a sorszámukkal együtt adja ki.
+    """
+    iterator = iter(indexed_points)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        next_points = list(islice(iterator, chunk_size - 1))
+        indices = _douglas_peucker_indices([point for _, point in chunk], tolerance)
+        if next_points:
+            # A szakasz utolsó pontja a következő szakasz első pontja lesz, ezért itt még nem adjuk ki.
+            yield from (chunk[i] for i in indices[:-1])
+            chunk = [chunk[-1], *next_points]
+        else:
+            yield from (chunk[i] for i in indices)
+            chunk = []
@@ -0,0 +1,95 @@
+# Python 3.12+
+from __future__ import annotations
+
+from functools import reduce
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tkinter as tk
+    from importlib.metadata import EntryPoint
+    from fundamental_classes import PolygonGraphics
+
+# A külső csomagok ebben a belépésipont-csoportban (entry point group) regisztrálhatnak síkidomosztályokat.
+# Pl. a pyproject.toml fájlban:
+# [project.entry-points."polygon_graphics.shapes"]
+# Star = "my_package.star:Star"
+ENTRY_POINT_GROUP = 'polygon_graphics.shapes'
+
+# A beépített síkidomosztályok helye "modul:osztálynév" alakban. A modulok csak az első használatkor töltődnek be.
+_BUILTIN_SHAPES: dict[str, str] = {
+    'Quadrilateral': 'shapes.quadrilaterals:Quadrilateral',
+    'Kite': 'shapes.quadrilaterals:Kite',
+    'Trapezoid': 'shapes.quadrilaterals:Trapezoid',
+    'Parallelogram': 'shapes.quadrilaterals:Parallelogram',
+    'Rhombus': 'shapes.quadrilaterals:Rhombus',
+    'Rectangle': 'shapes.quadrilaterals:Rectangle',
+    'Square': 'shapes.quadrilaterals:Square',
+    'Ellipse': 'shapes.ellipse_and_circle:Ellipse',
+    'Circle': 'shapes.ellipse_and_circle:Circle',
+    'Triangle': 'shapes.triangles:Triangle',
+    'ConcaveCircularHypotenuse': 'shapes.custom_shapes:ConcaveCircularHypotenuse',
+}
+
+# Síkidomnév -> "modul:osztálynév" hivatkozás, belépési pont vagy a már betöltött osztály.
+_registry: dict[str, str | EntryPoint | type[PolygonGraphics]] = dict(_BUILTIN_SHAPES)
+_entry_points_loaded = False
+
+
+def register_shape(name: str, shape_class: str | type[PolygonGraphics]) -> None:
+    """A síkidomosztályt a megadott néven regisztrálja. Az osztály megadható közvetlenül, vagy "modul:osztálynév"
+    alakú hivatkozással, amely esetben a modul csak az osztály első lekérésekor töltődik be.
+    A már regisztrált nevű síkidomot felülírja.
+    """
+    if isinstance(shape_class, str) and ':' not in shape_class:
+        raise ValueError('A síkidomosztály hivatkozása "modul:osztálynév" alakú kell, hogy legyen.')
+    _registry[name] = shape_class
+
+
+def _load_entry_points() -> None:
+    """A telepített csomagok által belépési pontként regisztrált síkidomosztályokat veszi fel a nyilvántartásba.
+    A beépített és a register_shape() függvénnyel regisztrált neveket nem írja felül.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    # Az importlib.metadata betöltése és a telepített csomagok átnézése lassú, ezért csak szükség esetén történik meg.
+    from importlib.metadata import entry_points
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        # A belépési pont értékét (pl. "csomag.modul:Külső.Síkidom [extra]") a load() metódusa értelmezi.
+        _registry.setdefault(entry_point.name, entry_point)
+
+
+def shape_names() -> list[str]:
+    """Az összes regisztrált síkidom nevének listáját adja vissza, a belépési pontként regisztráltakat is beleértve.
+    A síkidomosztályok moduljai nem töltődnek be.
+    """
+    _load_entry_points()
+    return sorted(_registry)
+
+
+def get_shape_class(name: str) -> type[PolygonGraphics]:
+    """A név szerint megadott síkidomosztállyal tér vissza. Az osztály modulját csak ekkor, az első lekéréskor
+    tölti be. Ha a név a beépített és regisztrált síkidomok között nincs, akkor a belépési pontok között keresi.
+    """
+    if name not in _registry:
+        _load_entry_points()
+    try:
+        shape_class = _registry[name]
+    except KeyError:
+        raise KeyError(f'Nincs "{name}" nevű síkidom regisztrálva.') from None
+    if isinstance(shape_class, str):
+        module_name, _, class_name = shape_class.partition(':')
+        # Az osztálynév pontokkal elválasztott attribútumútvonal is lehet (pl. "modul:Külső.Síkidom").
+        shape_class = _registry[name] = reduce(getattr, class_name.split('.'), import_module(module_name))
+    elif not isinstance(shape_class, type):
+        shape_class = _registry[name] = shape_class.load()  # Belépési pontként regisztrált síkidomosztály.
+    return shape_class
+
+
+def create_shape(name: str, canvas: tk.Canvas, *args, **options) -> PolygonGraphics:
+    """A név szerint megadott síkidomosztály egy új példányával tér vissza. Az argumentumokat változatlanul
+    továbbadja a síkidomosztály konstruktorának.
+    """
+    return get_shape_class(name)(canvas, *args, **options)
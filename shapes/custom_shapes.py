@@ -1,8 +1,13 @@
-import tkinter as tk
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from itertools import chain
 from math import sqrt, acos, degrees
 from fundamental_classes import PolygonGraphics
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 class ConcaveCircularHypotenuse(PolygonGraphics):
 
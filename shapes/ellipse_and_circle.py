@@ -1,7 +1,11 @@
-import tkinter as tk
-from typing import Self
+from __future__ import annotations
+
+from typing import Self, TYPE_CHECKING
 from fundamental_classes import PolygonGraphics
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 class Ellipse(PolygonGraphics):
 
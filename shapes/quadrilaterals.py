@@ -1,8 +1,12 @@
-from typing import Iterable, Self
+from __future__ import annotations
+
+from typing import Iterable, Self, TYPE_CHECKING
 from math import dist, isclose
-import tkinter as tk
 from fundamental_classes import PolygonGraphics
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 class Quadrilateral(PolygonGraphics):
     def __init__(self, canvas: tk.Canvas, *vertex_points, **options):
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from fundamental_classes import PolygonGraphics
-from typing import Self
-import tkinter as tk
+from typing import Self, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tkinter as tk
 
 
 class Triangle(PolygonGraphics):
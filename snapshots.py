@@ -0,0 +1,182 @@
+# Python 3.12+
+from typing import NamedTuple, Self
+from fundamental_classes import PolygonGraphics, Group
+
+
+class ShapeState(NamedTuple):
+    """Egy síkidom egy adott időpontbeli, megváltoztathatatlan állapota.
+    Az azonos állapotsorszámú (version) állapotok megegyeznek, ezért egy változatlan síkidom állapotát a
+    pillanatképek közösen használják.
+    """
+    version: int
+    coords: tuple[float, ...]
+    options: tuple[tuple[str, str], ...]
+    tags: tuple[str, ...]  # A síkidom saját címkéi az azonosító- és csoportcímkék nélkül.
+    groups: tuple[Group, ...]
+
+    @classmethod
+    def of(cls, polygon_graphics_object: PolygonGraphics) -> Self:
+        """A síkidom aktuális állapotát adja vissza."""
+        groups = tuple(polygon_graphics_object._groups)
+        # A csoportcímkéket a csoporttagság határozza meg, ezért azokat nem kell külön tárolni.
+        tags_not_stored = {polygon_graphics_object.id_tag, 'current', *(group._id_tag for group in groups)}
+        options = polygon_graphics_object.all_cget()
+        options.pop('tags', None)
+        return cls(version=polygon_graphics_object._version,
+                   coords=tuple(polygon_graphics_object.get_coords()),
+                   options=tuple(sorted(options.items())),
+                   tags=tuple(tag for tag in polygon_graphics_object.gettags() if tag not in tags_not_stored),
+                   groups=groups)
+
+
+class SceneSnapshot:
+    """A jelenet egy pillanatképe. Csak azoknak a síkidomoknak az állapotát tárolja, amelyek az előző
+    pillanatkép óta megváltoztak, a többi állapotot az előző pillanatképekkel közösen használja.
+    """
+
+    def __init__(self, parent: 'SceneSnapshot | None', changes: dict[PolygonGraphics, ShapeState]):
+        self._parent = parent
+        self._changes = changes
+
+    def __len__(self) -> int:
+        """Az előző pillanatképhez képest megváltozott síkidomok száma."""
+        return len(self._changes)
+
+    def states(self) -> dict[PolygonGraphics, ShapeState]:
+        """A pillanatképben rögzített összes síkidom állapotát adja vissza."""
+        chain = []
+        snapshot = self
+        while snapshot is not None:
+            chain.append(snapshot._changes)
+            snapshot = snapshot._parent
+        states = {}
+        # A régebbi állapotokat az újabbak írják felül.
+        for changes in reversed(chain):
+            states.update(changes)
+        return states
+
+
+class SceneHistory:
+    """A jelenet síkidomjainak állapotait pillanatképekben rögzítő előzménylista a visszavonás és
+    újra végrehajtás támogatására.
+    A pillanatképek a változások mértékével arányos memóriát használnak: a pillanatkép csak a legutóbbi
+    pillanatkép óta megváltozott síkidomok állapotát tárolja, a visszaállítás pedig csak azokat a síkidomokat
+    módosítja a vásznon, amelyek állapota eltér a visszaállítandótól.
+    Ha a limit meg van adva, akkor legfeljebb ennyi pillanatképet őriz meg.
+    """
+
+    def __init__(self, *scene: PolygonGraphics | Group, limit: int | None = None):
+        if limit is not None and limit < 1:
+            raise ValueError('A megőrzött pillanatképek száma legalább 1 kell, hogy legyen.')
+        self.limit = limit
+        self._graphics_objects: dict[PolygonGraphics, None] = {}  # A jelenet síkidomjai felvételük sorrendjében.
+        # A síkidomok legutóbb rögzített vagy visszaállított állapota.
+        self._current_states: dict[PolygonGraphics, ShapeState] = {}
+        self._snapshots: list[SceneSnapshot] = []
+        self._position = -1  # Az aktuális pillanatkép indexe.
+        self.track(*scene)
+
+    def track(self, *scene: PolygonGraphics | Group) -> None:
+        """A megadott síkidomokat, illetve csoportok síkidomjait felveszi a jelenetbe. Állapotuk a következő
+        pillanatképben rögzül.
+        """
+        for item in scene:
+            for g in (item.graphics_objects if isinstance(item, Group) else (item,)):
+                self._graphics_objects.setdefault(g)
+
+    def snapshot(self) -> SceneSnapshot:
+        """A jelenet aktuális állapotáról pillanatképet készít, és az előzménylistába teszi. Ha előzőleg
+        visszavonás történt, akkor a visszavont pillanatképek törlődnek.
+        Ha a legutóbb rögzített vagy visszaállított pillanatkép óta egyik síkidom sem változott, akkor nem jön
+        létre új visszavonási lépés, és a visszatérési érték az aktuális pillanatkép.
+        """
+        changes = {}
+        for g in self._graphics_objects:
+            state = self._current_states.get(g)
+            # A változatlan síkidom állapota nem kerül újra rögzítésre.
+            if state is None or state.version != g._version:
+                changes[g] = self._current_states[g] = ShapeState.of(g)
+        if not changes and self._position >= 0:
+            return self._snapshots[self._position]
+
+        del self._snapshots[self._position + 1:]
+        parent = self._snapshots[-1] if self._snapshots else None
+        snapshot = SceneSnapshot(parent, changes)
+        self._snapshots.append(snapshot)
+        if self.limit is not None and len(self._snapshots) > self.limit:
+            self._drop_oldest()
+        self._position = len(self._snapshots) - 1
+        return snapshot
+
+    def _drop_oldest(self) -> None:
+        """A legrégebbi pillanatképet törli úgy, hogy a következő pillanatkép helyére egy új, mindkettő állapotait
+        tartalmazó pillanatkép kerül. A korábban kiadott pillanatképek nem változnak.
+        """
+        oldest, next_oldest = self._snapshots.pop(0), self._snapshots[0]
+        merged = SceneSnapshot(None, {**oldest._changes, **next_oldest._changes})
+        self._snapshots[0] = merged
+        if len(self._snapshots) > 1:
+            self._snapshots[1]._parent = merged
+
+    def restore(self, snapshot: SceneSnapshot) -> int:
+        """A jelenetet a pillanatképben rögzített állapotba állítja vissza. Csak azokat a síkidomokat, és azoknak is
+        csak azokat a jellemzőit módosítja, amelyek eltérnek a rögzítettől.
+        A visszatérési érték a módosított síkidomok száma.
+        """
+        restored_count = 0
+        for g, state in snapshot.states().items():
+            if g._version == state.version:
+                continue
+            current_state = self._current_states.get(g)
+            if current_state is None or current_state.version != g._version:
+                current_state = ShapeState.of(g)
+            self._apply_state(g, current_state, state)
+            g._version = state.version
+            self._current_states[g] = state
+            restored_count += 1
+        return restored_count
+
+    @staticmethod
+    def _apply_state(polygon_graphics_object: PolygonGraphics, current_state: ShapeState, state: ShapeState) -> None:
+        """A síkidom jellemzői közül azokat állítja át, amelyek a current_state és a state állapotban eltérnek."""
+        g = polygon_graphics_object
+        if current_state.options != state.options:
+            current_options = dict(current_state.options)
+            g.config(**{k: v for k, v in state.options if current_options.get(k) != v})
+        if current_state.coords != state.coords:
+            g.set_coords(state.coords)
+        for tag in set(current_state.tags) - set(state.tags):
+            g.dtag(tag)
+        for tag in state.tags:
+            if tag not in current_state.tags:
+                g.add_tag(tag)
+        for group in current_state.groups:
+            if group not in state.groups:
+                group.remove_graphics(g)
+        for group in state.groups:
+            if group not in current_state.groups:
+                group.add_graphics(g)
+
+    def can_undo(self) -> bool:
+        """True értéket ad vissza, ha van visszavonható pillanatkép."""
+        return self._position > 0
+
+    def can_redo(self) -> bool:
+        """True értéket ad vissza, ha van újra végrehajtható pillanatkép."""
+        return self._position < len(self._snapshots) - 1
+
+    def undo(self) -> bool:
+        """A jelenetet az előző pillanatkép állapotába állítja vissza. False értéket ad vissza, ha nincs mit visszavonni."""
+        if not self.can_undo():
+            return False
+        self._position -= 1
+        self.restore(self._snapshots[self._position])
+        return True
+
+    def redo(self) -> bool:
+        """A visszavont pillanatkép állapotát állítja vissza. False értéket ad vissza, ha nincs mit újra végrehajtani."""
+        if not self.can_redo():
+            return False
+        self._position += 1
+        self.restore(self._snapshots[self._position])
+        return True
@@ -0,0 +1,63 @@
+# Python 3.12+
+"""A geometriai mag importálási idejét méri a "python -X importtime" kapcsolóval, és ellenőrzi, hogy
+az a megadott kereten belül marad-e, valamint hogy a tkinter nem töltődik-e be.
+Használat a projekt gyökérkönyvtárából: python tools/check_import_time.py [--budget-ms 60] [modul ...]
+Sikertelen ellenőrzés esetén a kilépési kód 1.
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# A gyors indulású eszközök által importált modulok és a betöltésük együttes időkerete ezredmásodpercben.
+DEFAULT_MODULES = ('geometry', 'fundamental_classes', 'shape_registry')
+DEFAULT_BUDGET_MS = 60.0
+
+# Ezek a modulok nem tölthetők be a geometriai mag importálásakor.
+FORBIDDEN_MODULES = ('tkinter', '_tkinter')
+
+
+def measure_import_times(modules: tuple[str, ...], repeat: int = 5) -> dict[str, int]:
+    """A modulok importálásával betöltött összes modul legkisebb mért kumulatív importálási idejét adja vissza
+    mikroszekundumban, repeat számú, külön folyamatban végzett mérés alapján.
+    """
+    best_times: dict[str, int] = {}
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {", ".join(modules)}'],
+                                cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            # A sorok alakja: "import time: <saját idő> | <kumulatív idő> | <modulnév>"
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, module_name = line.removeprefix('import time:').split('|')
+            module_name = module_name.strip()
+            best_times[module_name] = min(int(cumulative), best_times.get(module_name, int(cumulative)))
+    return best_times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='A geometriai mag importálási idejének ellenőrzése.')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help='a mérendő modulok')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='az időkeret ezredmásodpercben')
+    args = parser.parse_args()
+
+    import_times = measure_import_times(tuple(args.modules))
+    total_ms = sum(import_times.get(module, 0) for module in args.modules) / 1000
+    for module in args.modules:
+        print(f'{module:30} {import_times.get(module, 0) / 1000:8.2f} ms')
+    print(f'{"összesen":30} {total_ms:8.2f} ms (keret: {args.budget_ms:.2f} ms)')
+
+    ok = True
+    if loaded_forbidden := [module for module in FORBIDDEN_MODULES if module in import_times]:
+        print(f'HIBA: a következő modulok is betöltődtek: {", ".join(loaded_forbidden)}')
+        ok = False
+    if total_ms > args.budget_ms:
+        print('HIBA: az importálási idő túllépi a keretet.')
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+# Python 3.12+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from itertools import count, batched
+from fundamental_classes import PolygonGraphics, Group
+from geometry import simplify_polygon
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+
+class CanvasView:
+    """A síkidomok (a modell) megjelenítése egy további vásznon, saját nézeti transzformációval és
+    részletességi szinttel (pl. áttekintő kistérkép vagy osztott nézet).
+    A síkidomok csúcspontjait továbbra is az eredeti vászon tárolja; a nézet csak a rajzelemek azonosítóit és
+    néhány, a frissítéshez szükséges adatot tart nyilván. A síkidomok minden változásáról értesül, és a
+    változásokat a következő üresjárati ciklusban, síkidomonként egyszer viszi át a saját vásznára, de csak
+    akkor, ha a változás a nézet látható területét érinti. A rajzelemek megjelenítési sorrendje a síkidomok
+    eredeti vásznon érvényes sorrendjét követi.
+    A nézeti transzformáció a modellkoordinátákat a scale értékével szorozza, majd offset_x, offset_y értékkel
+    tolja el. A részletességi szintet két érték szabályozza: a lod_tolerance a nézet pixeleiben megadott
+    megengedett eltérés, amellyel a csúcspontok egyszerűsödnek, a min_size pedig az a pixelben mért méret,
+    amelynél kisebb síkidomok a nézetben nem jelennek meg.
+    """
+    _instance_counter = count(1)  # Az azonosítócímke létrehozásához használt, példányonkénti egyedi szám generátor.
+
+    def __init__(self, canvas: tk.Canvas, *scene: PolygonGraphics | Group, scale: int | float = 1,
+                 offset_x: int | float = 0, offset_y: int | float = 0,
+                 lod_tolerance: int | float = 0, min_size: int | float = 0):
+        if scale <= 0:
+            raise ValueError('A nézet léptéke pozitív szám kell, hogy legyen.')
+        self.canvas = canvas
+        self.id_tag: str = type(self).__name__ + str(next(self._instance_counter))
+        self.scale, self.offset_x, self.offset_y = scale, offset_x, offset_y
+        self.lod_tolerance, self.min_size = lod_tolerance, min_size
+        self._items: dict[PolygonGraphics, int] = {}  # Síkidom -> a nézet vásznán lévő rajzelem azonosítója.
+        self._options: dict[PolygonGraphics, dict] = {}  # A rajzelemre utoljára átvitt konfiguráció.
+        self._on_screen: dict[PolygonGraphics, bool] = {}  # Látszott-e a rajzelem a legutóbbi frissítéskor.
+        self._changed: dict[PolygonGraphics, None] = {}  # A következő frissítésre váró síkidomok.
+        self._restack_pending = False  # A megjelenítési sorrendet a következő frissítéskor igazítani kell.
+        self._update_scheduled = False
+        # A vászon megsemmisülésekor a nézet leválik a síkidomokról, hogy azok ne értesítsék tovább.
+        canvas.bind('<Destroy>', self._on_destroy, '+')
+        self.add(*scene)
+
+    def add(self, *scene: PolygonGraphics | Group) -> None:
+        """A megadott síkidomokat, illetve csoportok síkidomjait megjeleníti a nézetben."""
+        added = False
+        for item in scene:
+            for g in (item.graphics_objects if isinstance(item, Group) else (item,)):
+                if g in self._items:
+                    continue
+                self._items[g] = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, tags=(self.id_tag,))
+                g._views.append(self)
+                self._update(g, force=True)
+                added = True
+        if added:
+            self.restack()
+
+    def remove(self, *scene: PolygonGraphics | Group) -> None:
+        """A megadott síkidomokat, illetve csoportok síkidomjait eltávolítja a nézetből."""
+        for item in scene:
+            for g in (item.graphics_objects if isinstance(item, Group) else (item,)):
+                if g not in self._items:
+                    continue
+                self.canvas.delete(self._items.pop(g))
+                g._views.remove(self)
+                for registry in (self._options, self._on_screen, self._changed):
+                    registry.pop(g, None)
+
+    def detach(self) -> None:
+        """A nézet összes rajzelemét törli, és a nézetet leválasztja a síkidomokról."""
+        self.remove(*list(self._items))
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        """A nézet vásznának megsemmisülésekor a nézetet leválasztja a síkidomokról. A rajzelemek a vászonnal
+        együtt már törlődtek, ezért azokat nem kell törölni.
+        """
+        if event.widget is not self.canvas:
+            return
+        for g in self._items:
+            g._views.remove(self)
+        for registry in (self._items, self._options, self._on_screen, self._changed):
+            registry.clear()
+        self._restack_pending = False
+
+    def set_view(self, scale: int | float | None = None, offset_x: int | float | None = None,
+                 offset_y: int | float | None = None) -> None:
+        """A nézeti transzformációt módosítja. A meg nem adott értékek változatlanok maradnak.
+        Ezután minden síkidom újra megjelenik a nézetben, kivéve azokat, amelyek előtte és utána sem láthatók.
+        """
+        if scale is not None:
+            if scale <= 0:
+                raise ValueError('A nézet léptéke pozitív szám kell, hogy legyen.')
+            self.scale = scale
+        if offset_x is not None:
+            self.offset_x = offset_x
+        if offset_y is not None:
+            self.offset_y = offset_y
+        for g in self._items:
+            self._update(g)
+        self._changed.clear()
+
+    def mark_changed(self, polygon_graphics_object: PolygonGraphics) -> None:
+        """A síkidom változását jegyzi fel. A nézet a változásokat a vászon következő üresjárati ciklusában,
+        síkidomonként egyszer viszi át.
+        """
+        self._changed[polygon_graphics_object] = None
+        self._schedule_update()
+
+    def mark_restacked(self) -> None:
+        """A megjelenítési sorrend megváltozását jegyzi fel. A nézet a sorrendet a vászon következő üresjárati
+        ciklusában igazítja az eredeti vászonéhoz.
+        """
+        self._restack_pending = True
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        """A feljegyzett változások átvitelét a vászon következő üresjárati ciklusára ütemezi."""
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self.canvas.after_idle(self.update)
+
+    def update(self) -> None:
+        """A feljegyzett változásokat azonnal átviszi a nézet vásznára."""
+        self._update_scheduled = False
+        changed, self._changed = self._changed, {}
+        for g in changed:
+            self._update(g)
+        if self._restack_pending:
+            self.restack()
+
+    def restack(self) -> None:
+        """A nézet rajzelemeinek megjelenítési sorrendjét a síkidomok eredeti vásznon érvényes sorrendjéhez
+        igazítja. A síkidomok tag_raise() és tag_lower() metódusai ezt automatikusan kiváltják, a vászon
+        metódusaival közvetlenül végzett sorrendmódosítás után viszont meg kell hívni.
+        """
+        self._restack_pending = False
+        stacking_positions: dict[tk.Canvas, dict[int, int]] = {}
+
+        def stacking_key(g: PolygonGraphics) -> tuple[int, int]:
+            if g.canvas not in stacking_positions:
+                stacking_positions[g.canvas] = {item: position for position, item
+                                                in enumerate(g.canvas.find_withtag('all'))}
+            canvas_index = list(stacking_positions).index(g.canvas)
+            return canvas_index, stacking_positions[g.canvas][g.canvas.find_withtag(g.id_tag)[0]]
+
+        previous_item = None
+        # A rajzelemeket egymás után, mindig az előző fölé helyezzük, így a nézet rajzelemei a vászon más
+        # rajzelemeihez képest a helyükön maradnak.
+        for g in sorted(self._items, key=stacking_key):
+            if previous_item is not None:
+                self.canvas.tag_raise(self._items[g], previous_item)
+            previous_item = self._items[g]
+
+    def to_view(self, x: int | float, y: int | float) -> tuple[float, float]:
+        """A modellkoordinátákkal megadott pont nézetbeli koordinátáit adja vissza."""
+        return x * self.scale + self.offset_x, y * self.scale + self.offset_y
+
+    def _viewport(self) -> tuple[float, float, float, float]:
+        """A nézet vásznán éppen látható terület bal felső és jobb alsó sarkának koordinátáival tér vissza."""
+        # Megjelenítés előtt a vászon tényleges mérete még nem ismert, ilyenkor a kért méretet használjuk.
+        width = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else int(self.canvas.cget('width'))
+        height = self.canvas.winfo_height() if self.canvas.winfo_height() > 1 else int(self.canvas.cget('height'))
+        return self.canvas.canvasx(0), self.canvas.canvasy(0), self.canvas.canvasx(width), self.canvas.canvasy(height)
+
+    def _update(self, polygon_graphics_object: PolygonGraphics, force: bool = False) -> None:
+        """A síkidom rajzelemét a nézetben a síkidom aktuális állapotához igazítja. Ha a síkidom sem most, sem a
+        legutóbbi frissítéskor nem esik a látható területre, akkor a frissítés elmarad, amíg láthatóvá nem válik.
+        """
+        g = polygon_graphics_object
+        # A láthatóságot a síkidom gyorsítótárazott befoglaló téglalapjából döntjük el, így a látható területen
+        # kívül maradó síkidomok csúcspontjait le sem kell kérni.
+        model_x1, model_y1, model_x2, model_y2 = g.vertices_bbox()
+        (x1, y1), (x2, y2) = self.to_view(model_x1, model_y1), self.to_view(model_x2, model_y2)
+        vx1, vy1, vx2, vy2 = self._viewport()
+        on_screen = x1 <= vx2 and vx1 <= x2 and y1 <= vy2 and vy1 <= y2
+        if not (on_screen or self._on_screen.get(g) or force):
+            return
+        self._on_screen[g] = on_screen
+
+        options = g.all_cget()
+        del options['tags']
+        # A körvonal vastagsága a nézet léptékével együtt változik.
+        options['width'] = float(options['width']) * self.scale
+        if max(x2 - x1, y2 - y1) < self.min_size:
+            options['state'] = 'hidden'  # A nézetben túl kicsi síkidomot nem kell kirajzolni.
+
+        item = self._items[g]
+        if options.get('state') != 'hidden':
+            view_coords = [coord * self.scale + (self.offset_y if i % 2 else self.offset_x)
+                           for i, coord in enumerate(g.get_coords())]
+            if self.lod_tolerance:
+                view_coords = simplify_polygon(list(batched(view_coords, 2)), self.lod_tolerance)
+            self.canvas.coords(item, *view_coords)
+        previous_options = self._options.get(g, {})
+        changed_options = {k: v for k, v in options.items() if previous_options.get(k) != v}
+        if changed_options:
+            self.canvas.itemconfig(item, **changed_options)
+            self._options[g] = options